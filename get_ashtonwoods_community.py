@@ -5,6 +5,9 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
+import gzip
 import json
 import time
 import logging
@@ -12,9 +15,24 @@ import os
 import sys
 from datetime import datetime
 import re
+import shelve
+from functools import lru_cache
 from geopy.geocoders import Nominatim
 from geopy.exc import GeocoderTimedOut
 import argparse
+import asyncio
+import httpx
+from urllib.parse import urlsplit
+try:
+    import orjson
+except ImportError:
+    orjson = None
+import multiprocessing
+import multiprocessing.util
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import requests
 
 # Configure logging
 logging.basicConfig(
@@ -26,6 +44,126 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# Precompiled patterns used while parsing
+PRICE_RE = re.compile(r'\$[\d,]+K?')
+NUM_RE = re.compile(r'\d+(?:,\d+)?')
+PHONE_RE = re.compile(r'\(\d{3}\) \d{3}-\d{4}')
+PLANS_FROM_RE = re.compile(r'Plans from \$[\d,]+')
+STYLE_URL_RE = re.compile(r"url\(['\"]?([^'\")]+)['\"]?\)")
+# Value, label and optional half-bath suffix from a card feature list, e.g. '2 Baths | 1 Half Bath'
+FEATURE_RE = re.compile(r'(\S+) (Beds|Baths|sq\. ft\.)( \| \S+ Half)?')
+AMENITY_KEYWORDS = ['RV Garage', 'Private Bedroom', 'Covered Entry', 'Sliding Door']
+AMEN_RE = re.compile('|'.join(re.escape(keyword) for keyword in AMENITY_KEYWORDS))
+
+def has_class(name):
+    """XPath predicate matching elements whose class list contains name"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+# Compiled XPath lookups for the community panels and their property cards
+PANELS_XPATH = etree.XPath('//li[starts-with(@id, "panel-")]')
+CARD_ITEMS_XPATH = etree.XPath('.//div[@class="tabs__series-item tabs__series-item--third js-iframe-url"]')
+CARD_TITLE_XPATH = etree.XPath(f'(.//h4[{has_class("property-card__title")}]//a)[1]')
+CARD_IMAGE_XPATH = etree.XPath(f'(.//a[{has_class("property-card__image")}])[1]')
+CARD_PRICE_XPATH = etree.XPath(f'(.//div[{has_class("property-card__price")}])[1]//text()')
+CARD_FEATURES_XPATH = etree.XPath(f'(.//ul[{has_class("property-card__feature-list")}])[1]//text()')
+CARD_CONTENT_XPATH = etree.XPath(f'(.//div[{has_class("property-card__content")}])[1]')
+CONTENT_ITEMS_XPATH = etree.XPath('.//li')
+CONTENT_OVERVIEW_XPATH = etree.XPath('(.//p)[1]')
+
+# Community page sections, matched like the BeautifulSoup lookups they replace (first match only)
+REGEX_NS = {'re': 'http://exslt.org/regular-expressions'}
+NAME_XPATH = etree.XPath('(//h1)[1]')
+PLANS_FROM_TEXT_XPATH = etree.XPath(f'(//text()[re:test(., "{PLANS_FROM_RE.pattern}")])[1]', namespaces=REGEX_NS)
+PHONE_TEXT_XPATH = etree.XPath(f'(//text()[re:test(., "{PHONE_RE.pattern}")])[1]', namespaces=REGEX_NS)
+CONTENT_DIV_XPATH = etree.XPath(f'(//div[{has_class("image-content__main")}])[1]')
+SALES_OFFICE_ADDRESS_XPATH = etree.XPath('(.//p[. = "Sales Office"])[1]/following-sibling::p[1]')
+# Exact class match: the disclaimer expando carries the same classes plus 'disclaimer'
+DESCRIPTION_XPATH = etree.XPath(
+    '((//div[@class="js-expando is-initialized is-disabled is-expanded"])[1]'
+    f'//div[{has_class("image-content__main-content")}])[1]'
+)
+FIRST_P_XPATH = etree.XPath('(.//p)[1]')
+CAROUSEL_IMAGE_XPATH = etree.XPath(
+    f'((//div[{has_class("image-content__slider-container")}])[1]'
+    f'//div[{has_class("image-content__slide")}][@data-desktop-image != ""])[1]/@data-desktop-image'
+)
+
+# Visible text nodes mentioning any amenity keyword (skips JSON-LD and inline scripts)
+AMENITY_TEXT_XPATH = etree.XPath(
+    '//text()[not(ancestor::script or ancestor::style)][{}]'.format(
+        ' or '.join(f'contains(., "{keyword}")' for keyword in AMENITY_KEYWORDS)
+    )
+)
+
+# Shared HTTP session (keep-alive, gzip) for requests that don't need a browser
+session = requests.Session()
+session.headers.update({'User-Agent': USER_AGENT})
+
+# Batch mode prefetches static pages concurrently, politely spaced per host
+STATIC_CONCURRENCY = 8
+STATIC_HOST_DELAY = 0.25  # Minimum seconds between request starts to one host
+STATIC_BATCH_SIZE = 32  # URLs prefetched (and held in memory) at a time
+
+# Static HTML must already hold a property card inside one of these panels to be parsed
+# without Selenium; the panel ids also appear in the tab buttons, so a substring test isn't enough
+STATIC_SENTINELS = ('panel-home-plans', 'panel-quick-move-ins')
+
+# Hosts whose images are never useful; also blocked in the browser
+BLOCKED_IMAGE_HOSTS = ['bizible.com', 'marvel-b1-cdn']
+
+# Most images kept per homesite detail page
+MAX_HOMESITE_IMAGES = 12
+
+# Image URLs must come from an Ashton Woods host and not a blocked one
+BAD_HOST_RE = re.compile('|'.join(re.escape(host) for host in BLOCKED_IMAGE_HOSTS))
+GOOD_HOST_RE = re.compile(r'ashtonwoods\.com|widen\.net')
+
+# Only div/img elements that carry an image attribute, in document order
+IMAGE_CANDIDATE_SELECTOR = ', '.join(
+    f'{tag}{attr}'
+    for tag in ('div', 'img')
+    for attr in ('[data-desktop-image]', '[src]', '[style*="background-image"]')
+)
+
+# Requests Chrome should never make: junk image hosts, trackers and web fonts
+BLOCKED_URL_PATTERNS = [f'*{host}*' for host in BLOCKED_IMAGE_HOSTS] + [
+    '*google-analytics.com*',
+    '*doubleclick.net*',
+    '*.woff2',
+]
+
+# Property cards the parser reads; pages without any fall through after at most the old fixed 5s sleep
+PANEL_READY_SELECTOR = '#panel-home-plans .tabs__series-item, #panel-quick-move-ins .tabs__series-item'
+PANEL_WAIT_TIMEOUT = 5
+
+# Maps each URL to the ETag/Last-Modified seen when its JSON was last written
+CACHE_INDEX_FILE = 'data/ashtonwoods/cache_index.json'
+
+# Number of browsers used to fetch homesite detail pages in parallel
+HOMESITE_WORKERS = max(1, min(4, (os.cpu_count() or 2) // 2))
+
+# Clear cookies/cache every few pages and restart Chrome periodically to cap memory
+DRIVER_CLEAR_EVERY = 10
+DRIVER_RECYCLE_AFTER = 50
+
+# Community centroid for Laveen, AZ 85339, used when homesites aren't geocoded
+DEFAULT_LATITUDE = 33.3539
+DEFAULT_LONGITUDE = -112.1597
+
+# Per-homesite geocoding is opt-in (AW_GEOCODE=1); otherwise homesites use the centroid
+GEOCODE_ENABLED = os.getenv("AW_GEOCODE") == "1"
+
+# Geocoding: one shared client and a persistent cache keyed on normalized address
+geolocator = Nominatim(user_agent="ashtonwoods_scraper")
+GEOCODE_CACHE_FILE = 'data/ashtonwoods/geocode_cache'
+GEOCODE_NEGATIVE_TTL = 7 * 24 * 3600  # Retry failed lookups after a week
+GEOCODE_INTERVAL = 1.0  # Seconds each worker waits after a Nominatim request
+# The public Nominatim server allows 1 request/s in total; raise this only for a private instance
+GEOCODE_WORKERS = int(os.getenv("AW_GEOCODE_WORKERS", "1"))
+geocode_cache_lock = threading.Lock()
+
 def setup_driver():
     """Set up Chrome driver with appropriate options"""
     chrome_options = Options()
@@ -34,15 +172,123 @@ def setup_driver():
     chrome_options.add_argument('--no-sandbox')
     chrome_options.add_argument('--disable-dev-shm-usage')
     chrome_options.add_argument('--window-size=1920,1080')
-    chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-    return webdriver.Chrome(options=chrome_options)
+    chrome_options.add_argument(f'user-agent={USER_AGENT}')
+    # Only text and image URLs are scraped, so skip downloading images and fonts
+    chrome_options.add_experimental_option('prefs', {
+        'profile.managed_default_content_settings.images': 2,
+        'profile.managed_default_content_settings.fonts': 2
+    })
+    driver = webdriver.Chrome(options=chrome_options)
+    driver.execute_cdp_cmd('Network.enable', {})
+    driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+    return driver
+
+def start_driver():
+    """Start a Chrome driver, logging and returning None if it fails so the caller can retry later"""
+    try:
+        return setup_driver()
+    except Exception as e:
+        logger.error(f"Error starting Chrome driver: {str(e)}")
+        return None
+
+def maintain_driver(driver, uses, pages=1):
+    """Clear browser state periodically and restart Chrome to cap renderer memory
+
+    uses is the number of pages driver has loaded, including the pages just loaded;
+    a step of several pages still triggers the clear/recycle it stepped over.
+    Returns None if the restart fails; the old driver has been quit by then.
+    """
+    if uses // DRIVER_RECYCLE_AFTER > (uses - pages) // DRIVER_RECYCLE_AFTER:
+        logger.info(f"Recycling Chrome driver after {uses} pages")
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.error(f"Error closing driver: {str(e)}")
+        return start_driver()
+    if uses // DRIVER_CLEAR_EVERY > (uses - pages) // DRIVER_CLEAR_EVERY:
+        try:
+            driver.delete_all_cookies()
+            driver.execute_cdp_cmd('Network.clearBrowserCache', {})
+        except Exception as e:
+            logger.error(f"Error clearing browser state: {str(e)}")
+    return driver
+
+class DriverPool:
+    """Pool of Chrome drivers shared by worker threads, created on demand and reused across pages"""
+    
+    def __init__(self, size):
+        self.size = size
+        self._drivers = queue.Queue()
+        self._all = []
+        self._uses = {}
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Get an idle driver, starting a new one if the pool isn't full yet"""
+        while True:
+            try:
+                return self._drivers.get_nowait()
+            except queue.Empty:
+                pass
+            with self._lock:
+                if len(self._all) < self.size:
+                    driver = setup_driver()
+                    self._all.append(driver)
+                    return driver
+            # Re-check periodically in case a slot was freed by a failed restart
+            try:
+                return self._drivers.get(timeout=1)
+            except queue.Empty:
+                continue
+    
+    def release(self, driver):
+        """Return a driver to the pool, recycling it once it has served enough pages"""
+        with self._lock:
+            uses = self._uses.pop(driver, 0) + 1
+        fresh = maintain_driver(driver, uses)
+        if fresh is None:
+            # The old driver is already quit; drop its slot so acquire() can start a new one
+            with self._lock:
+                if driver in self._all:
+                    self._all.remove(driver)
+            return
+        with self._lock:
+            if fresh is not driver:
+                self._all[self._all.index(driver)] = fresh
+                uses = 0
+            self._uses[fresh] = uses
+        self._drivers.put(fresh)
+    
+    def close(self):
+        """Quit every driver started by the pool"""
+        with self._lock:
+            for driver in self._all:
+                try:
+                    driver.quit()
+                except Exception as e:
+                    logger.error(f"Error closing driver: {str(e)}")
+            self._all = []
+            self._uses = {}
+            self._drivers = queue.Queue()
+
+def wait_for_community_content(driver):
+    """Wait for the community heading, then briefly for the plan/home property cards"""
+    WebDriverWait(driver, 20).until(
+        EC.presence_of_element_located((By.CSS_SELECTOR, "h1"))
+    )
+    try:
+        WebDriverWait(driver, PANEL_WAIT_TIMEOUT, poll_frequency=0.25).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, PANEL_READY_SELECTOR))
+        )
+    except TimeoutException:
+        logger.info(f"No plan/home cards after {PANEL_WAIT_TIMEOUT}s, parsing what is loaded")
 
 def extract_price_range(text):
     """Extract price range from text"""
     if not text:
         return None
     # Remove any non-price characters and split
-    prices = re.findall(r'\$[\d,]+K?', text)
+    prices = PRICE_RE.findall(text)
     if not prices:
         return None
     return f"From {prices[0]}" if len(prices) == 1 else f"{prices[0]}-{prices[1]}"
@@ -51,29 +297,66 @@ def extract_number_range(text):
     """Extract number range from text"""
     if not text:
         return None
-    numbers = re.findall(r'\d+(?:,\d+)?', text)
+    numbers = NUM_RE.findall(text)
     if not numbers:
         return None
     return f"{numbers[0]} - {numbers[-1]}" if len(numbers) > 1 else numbers[0]
 
+def get_range_from_values(values):
+    """Fold numeric values into a "min - max" string in a single pass, skipping non-numbers"""
+    low = high = None
+    for value in values:
+        if value is None:
+            continue
+        try:
+            number = float(value)
+        except (TypeError, ValueError):
+            continue
+        if low is None or number < low:
+            low = number
+        if high is None or number > high:
+            high = number
+    if low is None:
+        return None
+    return f"{int(low)}" if low == high else f"{int(low)} - {int(high)}"
+
+def get_detail_range(data, key):
+    """Range of a numeric field across homesites, falling back to homeplans"""
+    return (get_range_from_values(home.get(key) for home in data["homesites"])
+            or get_range_from_values(plan.get("details", {}).get(key) for plan in data["homeplans"]))
+
 def clean_text(text):
     """Clean and normalize text"""
     if not text:
         return None
     return ' '.join(text.strip().split())
 
-def parse_address(soup):
-    """Parse address from the sales office section"""
+def read_json(path):
+    """Load JSON from a file, using orjson when available"""
+    if orjson:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def write_json(path, data, pretty=True):
+    """Write data as UTF-8 JSON, using orjson when available"""
+    if orjson:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=option))
+        return
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2 if pretty else None, ensure_ascii=False)
+
+def parse_address(content_div):
+    """Parse address from the sales office section of the main content div (lxml element)"""
     try:
-        # Find the div containing the sales office information
-        content_div = soup.find('div', class_='image-content__main')
-        if content_div:
+        if content_div is not None:
             # Find the sales office text and get the next paragraph
-            sales_office = content_div.find('p', string='Sales Office')
-            if sales_office and sales_office.find_next_sibling('p'):
+            for address_p in SALES_OFFICE_ADDRESS_XPATH(content_div):
                 # Get the address text and split by <br> tags
-                address_p = sales_office.find_next_sibling('p')
-                address_parts = [part.strip() for part in address_p.stripped_strings]
+                address_parts = [part.strip() for part in address_p.itertext() if part.strip()]
                 
                 if len(address_parts) >= 2:
                     street = address_parts[0]
@@ -102,8 +385,8 @@ def parse_address(soup):
         "market": "Phoenix"
     }
 
-def parse_community_data(driver, url):
-    """Parse community page and extract data"""
+def parse_community_data(driver, url, pool=None, html=None):
+    """Parse community page and extract data, from html if given, otherwise from the driver"""
     data = {
         "timestamp": datetime.now().isoformat(),
         "url": url,
@@ -112,32 +395,35 @@ def parse_community_data(driver, url):
     }
     
     try:
-        # Wait for main content to load
-        WebDriverWait(driver, 20).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "h1"))
-        )
-        time.sleep(5)  # Allow dynamic content to load
+        if html is None:
+            # Wait for main content to load
+            wait_for_community_content(driver)
+            html = driver.page_source
+        
+        # Parse the page once into a plain lxml tree, queried with compiled XPath
+        tree = lxml.html.fromstring(html)
         
-        # Get page source and create soup
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
+        # Look up the page sections used below once, up front
+        panels = {panel.get('id'): panel for panel in PANELS_XPATH(tree)}
+        content_div = next(iter(CONTENT_DIV_XPATH(tree)), None)
         
         # Extract community name
-        name_elem = soup.find('h1')
-        data["name"] = clean_text(name_elem.text) if name_elem else None
+        name_elem = next(iter(NAME_XPATH(tree)), None)
+        data["name"] = clean_text(name_elem.text_content()) if name_elem is not None else None
         
         # Extract price range
-        price_text = soup.find(string=re.compile(r'Plans from \$[\d,]+'))
+        price_text = next(iter(PLANS_FROM_TEXT_XPATH(tree)), None)
         if price_text:
             data["price_from"] = extract_price_range(price_text)
         
         # Extract address and location information
-        address_info = parse_address(soup)
+        address_info = parse_address(content_div)
         data["address"] = address_info["full_address"]
         
         # Create location dict with coordinates and address
         data["location"] = {
-            "latitude": 33.3539,  # Coordinates for Laveen, AZ 85339
-            "longitude": -112.1597,
+            "latitude": DEFAULT_LATITUDE,
+            "longitude": DEFAULT_LONGITUDE,
             "address": {
                 "city": address_info["city"],
                 "state": address_info["state"],
@@ -146,31 +432,30 @@ def parse_community_data(driver, url):
         }
         
         # Extract phone
-        phone_elem = soup.find(string=re.compile(r'\(\d{3}\) \d{3}-\d{4}'))
+        phone_elem = next(iter(PHONE_TEXT_XPATH(tree)), None)
         data["phone"] = clean_text(phone_elem) if phone_elem else None
         
         # Extract description
-        desc_container = soup.find('div', {'class': 'js-expando is-initialized is-disabled is-expanded'})
         data["description"] = None
-        if desc_container and desc_container.find('div', {'class': 'image-content__main-content'}):
-            first_p = desc_container.find('div', {'class': 'image-content__main-content'}).find('p')
-            if first_p:
-                data["description"] = clean_text(first_p.text)
-        
-        # Extract one image from carousel
-        data["images"] = []
-        carousel = soup.find('div', class_='image-content__slider-container')
-        if carousel:
-            # Try to find desktop images from the carousel
-            slides = carousel.find_all('div', class_='image-content__slide')
-            for slide in slides:
-                if slide.get('data-desktop-image'):
-                    data["images"].append(slide['data-desktop-image'])
-                    break
+        for desc_content in DESCRIPTION_XPATH(tree):
+            for first_p in FIRST_P_XPATH(desc_content):
+                data["description"] = clean_text(first_p.text_content())
+        
+        # Extract one image from carousel, the first slide with a desktop image
+        data["images"] = [str(image) for image in CAROUSEL_IMAGE_XPATH(tree)]
         
         # Find all floor plans and homesites first
-        data["homeplans"] = parse_homeplans(soup)
-        data["homesites"] = parse_homesites(soup, driver)
+        data["homeplans"] = parse_homeplans(panels.get('panel-home-plans'))
+        data["homesites"] = parse_homesites(panels.get('panel-quick-move-ins'), driver, pool)
+        
+        if GEOCODE_ENABLED:
+            # Geocode each unique homesite address in one pass, then fill in coordinates
+            coords = batch_geocode({home["address"] for home in data["homesites"] if home["address"]})
+            for home in data["homesites"]:
+                lat, lon = coords.get(home["address"], (None, None))
+                if lat and lon:
+                    home["latitude"] = lat
+                    home["longitude"] = lon
         
         # If no images found in carousel, try to get one from homeplans or homesites
         if not data["images"]:
@@ -187,137 +472,113 @@ def parse_community_data(driver, url):
                         data["images"].append(site["image_url"])
                         break
         
-        # Generate ranges from homesites and homeplans
-        def get_range_from_values(values):
-            if not values:
-                return None
-            values = [float(v) for v in values if v is not None]
-            if not values:
-                return None
-            min_val = min(values)
-            max_val = max(values)
-            return f"{int(min_val)}" if min_val == max_val else f"{int(min_val)} - {int(max_val)}"
-        
-        # Try to get ranges from homesites first
-        sqft_values = [h["sqft"] for h in data["homesites"] if h.get("sqft")]
-        bed_values = [h["beds"] for h in data["homesites"] if h.get("beds")]
-        bath_values = [float(h["baths"]) for h in data["homesites"] if h.get("baths")]
-        
-        # If no values in homesites, try homeplans
-        if not sqft_values:
-            sqft_values = [h["details"]["sqft"] for h in data["homeplans"] if h.get("details", {}).get("sqft")]
-        if not bed_values:
-            bed_values = [h["details"]["beds"] for h in data["homeplans"] if h.get("details", {}).get("beds")]
-        if not bath_values:
-            bath_values = [float(h["details"]["baths"]) for h in data["homeplans"] if h.get("details", {}).get("baths")]
-        
         # Create details dict
         data["details"] = {
             "price_range": data["price_from"],
-            "sqft_range": get_range_from_values(sqft_values),
-            "bed_range": get_range_from_values(bed_values),
-            "bath_range": get_range_from_values(bath_values),
+            "sqft_range": get_detail_range(data, "sqft"),
+            "bed_range": get_detail_range(data, "beds"),
+            "bath_range": get_detail_range(data, "baths"),
             "stories_range": "1 - 2",
             "community_count": 1
         }
         
         # Extract amenities
-        data["amenities"] = parse_amenities(soup)
+        data["amenities"] = parse_amenities(tree)
         
         # Extract nearby places
-        data["nearbyplaces"] = parse_nearby_places(soup)
+        data["nearbyplaces"] = parse_nearby_places(tree)
         
         # Extract collections and schools
-        data["collections"] = parse_collections(soup)
+        data["collections"] = parse_collections(tree)
         
     except Exception as e:
         logger.error(f"Error parsing community data: {str(e)}")
         
     return data
 
-def parse_homeplans(soup):
-    """Parse home plans data"""
+def parse_property_card(card):
+    """Parse the fields shared by home plan and homesite property cards (lxml elements)"""
+    card_data = {
+        "name": None,
+        "url": None,
+        "image_url": None,
+        "price": None,
+        "beds": None,
+        "baths": None,
+        "sqft": None,
+        "features": [],
+        "overview": None
+    }
+    
+    # Extract name and URL
+    for title_link in CARD_TITLE_XPATH(card):
+        card_data["name"] = clean_text(title_link.text_content())
+        card_data["url"] = "https://www.ashtonwoods.com" + title_link.attrib['href']
+    
+    # Extract image URL
+    for image_elem in CARD_IMAGE_XPATH(card):
+        if image_elem.get('data-desktop-image'):
+            card_data["image_url"] = image_elem.get('data-desktop-image')
+        elif image_elem.get('style'):
+            url_match = STYLE_URL_RE.search(image_elem.get('style'))
+            if url_match:
+                card_data["image_url"] = url_match.group(1)
+    
+    # Extract price, removing 'From ' prefix if exists
+    price_text = clean_text(''.join(CARD_PRICE_XPATH(card)))
+    if price_text:
+        card_data["price"] = price_text.replace('From ', '')
+    
+    # Extract beds/baths/sqft from feature list in a single scan
+    feature_text = clean_text(' '.join(CARD_FEATURES_XPATH(card))) or ''
+    for value, label, half in FEATURE_RE.findall(feature_text):
+        if label == 'Beds':
+            card_data["beds"] = value
+        elif label == 'Baths':
+            card_data["baths"] = f"{value}.5" if half else value
+        else:
+            card_data["sqft"] = value.replace(',', '')
+    
+    # Extract highlights and overview from content section
+    for content in CARD_CONTENT_XPATH(card):
+        for idx, item in enumerate(CONTENT_ITEMS_XPATH(content)):
+            item_text = clean_text(item.text_content())
+            if item_text:
+                card_data["features"].append({
+                    "section_index": str(idx),
+                    "description": item_text
+                })
+        for overview in CONTENT_OVERVIEW_XPATH(content):
+            card_data["overview"] = clean_text(overview.text_content())
+    
+    return card_data
+
+def parse_homeplans(panel):
+    """Parse home plans data from the home plans panel (lxml element)"""
     homeplans = []
     
-    # First find the home plans panel
-    panel = soup.find('li', {'id': 'panel-home-plans'})
-    if panel:
+    if panel is not None:
         # Then find all series items within the panel
-        plan_elements = panel.find_all('div', class_='tabs__series-item tabs__series-item--third js-iframe-url')
+        plan_elements = CARD_ITEMS_XPATH(panel)
         
         for plan in plan_elements:
             try:
+                card = parse_property_card(plan)
                 plan_data = {
-                    "name": None,
-                    "url": None,
+                    "name": card["name"],
+                    "url": card["url"],
                     "details": {
-                        "price": None,
-                        "beds": None,
-                        "baths": None,
-                        "sqft": None,
+                        "price": card["price"],
+                        "beds": card["beds"],
+                        "baths": card["baths"],
+                        "sqft": card["sqft"],
                         "status": "Actively selling",
-                        "image_url": None
+                        "image_url": card["image_url"]
                     },
-                    "includedFeatures": [],
+                    "includedFeatures": card["features"],
                     "floorplan_images": []
                 }
                 
-                # Extract plan name and URL
-                name_elem = plan.find('h4', class_='property-card__title')
-                if name_elem and name_elem.find('a'):
-                    plan_data["name"] = clean_text(name_elem.find('a').text)
-                    plan_data["url"] = "https://www.ashtonwoods.com" + name_elem.find('a')['href']
-                
-                # Extract image URL
-                image_elem = plan.find('a', class_='property-card__image')
-                if image_elem:
-                    if image_elem.get('data-desktop-image'):
-                        plan_data["details"]["image_url"] = image_elem['data-desktop-image']
-                    elif image_elem.get('style'):
-                        style = image_elem['style']
-                        url_match = re.search(r"url\('([^']+)'\)", style)
-                        if url_match:
-                            plan_data["details"]["image_url"] = url_match.group(1)
-                
-                # Extract price
-                price_elem = plan.find('div', class_='property-card__price')
-                if price_elem:
-                    price_text = clean_text(price_elem.text)
-                    if price_text:
-                        # Remove 'From ' prefix if exists
-                        price_text = price_text.replace('From ', '')
-                        plan_data["details"]["price"] = price_text
-                
-                # Extract beds/baths/sqft from feature list
-                feature_list = plan.find('ul', class_='property-card__feature-list')
-                if feature_list:
-                    features = feature_list.find_all('li')
-                    for feature in features:
-                        text = clean_text(feature.get_text())
-                        if 'Beds' in text:
-                            plan_data["details"]["beds"] = text.split()[0]
-                        elif 'Baths' in text:
-                            bath_parts = text.split('|')
-                            main_baths = bath_parts[0].strip().split()[0]
-                            if len(bath_parts) > 1 and 'Half' in bath_parts[1]:
-                                plan_data["details"]["baths"] = f"{main_baths}.5"
-                            else:
-                                plan_data["details"]["baths"] = main_baths
-                        elif 'sq. ft.' in text:
-                            plan_data["details"]["sqft"] = text.split()[0].replace(',', '')
-                
-                # Extract included features from highlights section
-                highlights = plan.find('div', class_='property-card__content')
-                if highlights:
-                    feature_items = highlights.find_all('li')
-                    for idx, item in enumerate(feature_items):
-                        feature_text = clean_text(item.get_text())
-                        if feature_text:
-                            plan_data["includedFeatures"].append({
-                                "section_index": str(idx),
-                                "description": feature_text
-                            })
-                
                 # Only add plans that have required data
                 if plan_data["name"] and plan_data["url"]:
                     homeplans.append(plan_data)
@@ -328,12 +589,11 @@ def parse_homeplans(soup):
     
     return homeplans
 
-def get_coordinates(address):
-    """Get latitude and longitude for an address using geocoding"""
+def geocode_address(address):
+    """Look up an address with Nominatim, returning (lat, lon) or (None, None)"""
     try:
-        geolocator = Nominatim(user_agent="ashtonwoods_scraper")
         location = geolocator.geocode(address)
-        time.sleep(1)  # Rate limiting
+        time.sleep(GEOCODE_INTERVAL)  # Rate limiting
         if location:
             return location.latitude, location.longitude
         return None, None
@@ -343,6 +603,39 @@ def get_coordinates(address):
         logger.error(f"Error geocoding address: {str(e)}")
         return None, None
 
+@lru_cache(maxsize=4096)
+def get_coordinates(address):
+    """Get latitude and longitude for an address, using the on-disk cache when possible"""
+    key = ' '.join(address.strip().lower().split())
+    os.makedirs(os.path.dirname(GEOCODE_CACHE_FILE), exist_ok=True)
+    # shelve isn't thread-safe, so only hold the lock while touching the file
+    with geocode_cache_lock, shelve.open(GEOCODE_CACHE_FILE) as cache:
+        cached = cache.get(key)
+    if cached:
+        lat, lon, cached_at = cached
+        # Negative results expire so a transient failure is retried later
+        if lat is not None or time.time() - cached_at < GEOCODE_NEGATIVE_TTL:
+            return lat, lon
+    
+    lat, lon = geocode_address(address)
+    with geocode_cache_lock, shelve.open(GEOCODE_CACHE_FILE) as cache:
+        cache[key] = (lat, lon, time.time())
+    return lat, lon
+
+def batch_geocode(addresses, workers=GEOCODE_WORKERS):
+    """Geocode a set of addresses with a few rate-limited workers, returning {address: (lat, lon)}"""
+    addresses = list(addresses)
+    if not addresses:
+        return {}
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        return dict(zip(addresses, executor.map(get_coordinates, addresses)))
+
+def is_valid_image_url(url):
+    """Check that an image URL is a string from an allowed, non-blocked host"""
+    if not url or not isinstance(url, str):
+        return False
+    return not BAD_HOST_RE.search(url) and bool(GOOD_HOST_RE.search(url))
+
 def get_homesite_images(driver, url):
     """Get images from homesite detail page."""
     try:
@@ -358,101 +651,95 @@ def get_homesite_images(driver, url):
                 wait.until(EC.presence_of_element_located((By.CLASS_NAME, "col-12")))
 
         # Get page source after JavaScript renders
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
-        
-        images = []
-        
-        # Helper function to validate and clean image URL
-        def is_valid_image_url(url):
-            if not url:
-                return False
-            if not isinstance(url, str):
-                return False
-            if 'bizible.com' in url or 'marvel-b1-cdn' in url:
-                return False
-            if not ('ashtonwoods.com' in url or 'widen.net' in url):
-                return False
-            return True
+        soup = BeautifulSoup(driver.page_source, 'lxml')
+        
+        images, seen = [], set()
+        
+        def add_image(img_url):
+            """Add a new valid image URL, returning True once the limit is reached"""
+            if img_url and img_url not in seen and is_valid_image_url(img_url):
+                seen.add(img_url)
+                images.append(img_url)
+            return len(images) >= MAX_HOMESITE_IMAGES
 
         # Try to get images from gallery modal
         gallery_items = soup.find_all('div', class_='gallery-modal__item')
         for item in gallery_items:
-            img_url = item.get('data-desktop-image')
-            if is_valid_image_url(img_url) and img_url not in images:
-                images.append(img_url)
+            if add_image(item.get('data-desktop-image')):
+                break
 
         # Try to get images from main content area
         if not images:
-            for img in soup.find_all(['div', 'img']):
-                # Check data-desktop-image attribute
-                img_url = img.get('data-desktop-image')
-                if is_valid_image_url(img_url) and img_url not in images:
-                    images.append(img_url)
-                    
-                # Check src attribute
-                img_url = img.get('src')
-                if is_valid_image_url(img_url) and img_url not in images:
-                    images.append(img_url)
-                    
+            for img in soup.select(IMAGE_CANDIDATE_SELECTOR):
                 # Check style attribute for background-image
+                background_url = None
                 style = img.get('style')
                 if style and 'background-image' in style:
-                    match = re.search(r'url\(["\']?(.*?)["\']?\)', style)
+                    match = STYLE_URL_RE.search(style)
                     if match:
-                        img_url = match.group(1)
-                        if is_valid_image_url(img_url) and img_url not in images:
-                            images.append(img_url)
+                        background_url = match.group(1)
+                
+                # Check data-desktop-image, src, then background image; stop at the limit
+                if (add_image(img.get('data-desktop-image'))
+                        or add_image(img.get('src'))
+                        or add_image(background_url)):
+                    break
 
-        # Limit to 12 images
-        return images[:12]
+        return images
         
     except Exception as e:
         print(f"Error getting images from {url}: {str(e)}")
         return []
 
-def parse_homesites(soup, driver):
-    """Parse available homes data"""
+def fetch_homesite_images(driver, urls, pool=None):
+    """Get images for each homesite URL, preserving order"""
+    if not pool:
+        return [get_homesite_images(driver, url) for url in urls]
+    
+    def fetch(url):
+        try:
+            pooled_driver = pool.acquire()
+        except Exception as e:
+            logger.error(f"Error starting driver for {url}: {str(e)}")
+            return []
+        try:
+            return get_homesite_images(pooled_driver, url)
+        finally:
+            pool.release(pooled_driver)
+    
+    with ThreadPoolExecutor(max_workers=pool.size) as executor:
+        return list(executor.map(fetch, urls))
+
+def parse_homesites(panel, driver, pool=None):
+    """Parse available homes data from the quick move-ins panel (lxml element)"""
     homesites = []
     
-    # First find the quick-move-ins panel
-    panel = soup.find('li', {'id': 'panel-quick-move-ins'})
-    if panel:
+    if panel is not None:
         # Find all quick move-in homes within the panel
-        home_elements = panel.find_all('div', class_='tabs__series-item tabs__series-item--third js-iframe-url')
+        home_elements = CARD_ITEMS_XPATH(panel)
         
         for idx, home in enumerate(home_elements, 1):
             try:
+                card = parse_property_card(home)
                 home_data = {
                     "name": None,
-                    "plan": None,
+                    "plan": card["name"],  # Original plan name from the title
                     "id": str(idx),
                     "address": None,
-                    "price": None,
-                    "beds": None,
-                    "baths": None,
-                    "sqft": None,
+                    "price": card["price"],
+                    "beds": card["beds"],
+                    "baths": card["baths"],
+                    "sqft": card["sqft"],
                     "status": "Move-in Ready",
                     "image_url": None,
-                    "url": None,
+                    "url": card["url"],
                     "latitude": None,
                     "longitude": None,
-                    "overview": None,
+                    "overview": card["overview"],
                     "images": []
                 }
                 
-                # Extract home name and URL
-                name_elem = home.find('h4', class_='property-card__title')
-                if name_elem and name_elem.find('a'):
-                    # Get original plan name from the title
-                    home_data["plan"] = clean_text(name_elem.find('a').text)
-                    home_data["url"] = "https://www.ashtonwoods.com" + name_elem.find('a')['href']
-                    
-                    # Get images from detail page
-                    detail_images = get_homesite_images(driver, home_data["url"])
-                    if detail_images:
-                        home_data["images"] = detail_images
-                        home_data["image_url"] = detail_images[0]  # Use first image as main image
-                    
+                if home_data["url"]:
                     # Extract address from URL
                     url_parts = home_data["url"].split('/')
                     if len(url_parts) > 0:
@@ -468,50 +755,8 @@ def parse_homesites(soup, driver):
                             name_without_zip = f"{street_number} {street_direction} {street_name}, Laveen, AZ"
                             home_data["address"] = address
                             home_data["name"] = name_without_zip
-                            
-                            # Get coordinates for the address
-                            lat, lon = get_coordinates(address)
-                            if lat and lon:
-                                home_data["latitude"] = lat
-                                home_data["longitude"] = lon
-                            else:
-                                # Fallback to community coordinates if geocoding fails
-                                home_data["latitude"] = 33.3539
-                                home_data["longitude"] = -112.1597
-                
-                # Extract price
-                price_elem = home.find('div', class_='property-card__price')
-                if price_elem:
-                    price_text = clean_text(price_elem.text)
-                    if price_text:
-                        # Remove 'From ' prefix if exists
-                        price_text = price_text.replace('From ', '')
-                        home_data["price"] = price_text
-                
-                # Extract beds/baths/sqft from feature list
-                feature_list = home.find('ul', class_='property-card__feature-list')
-                if feature_list:
-                    features = feature_list.find_all('li')
-                    for feature in features:
-                        text = clean_text(feature.get_text())
-                        if 'Beds' in text:
-                            home_data["beds"] = text.split()[0]
-                        elif 'Baths' in text:
-                            bath_parts = text.split('|')
-                            main_baths = bath_parts[0].strip().split()[0]
-                            if len(bath_parts) > 1 and 'Half' in bath_parts[1]:
-                                home_data["baths"] = f"{main_baths}.5"
-                            else:
-                                home_data["baths"] = main_baths
-                        elif 'sq. ft.' in text:
-                            home_data["sqft"] = text.split()[0].replace(',', '')
-                
-                # Extract overview/description
-                content = home.find('div', class_='property-card__content')
-                if content:
-                    overview = content.find('p')
-                    if overview:
-                        home_data["overview"] = clean_text(overview.get_text())
+                            home_data["latitude"] = DEFAULT_LATITUDE
+                            home_data["longitude"] = DEFAULT_LONGITUDE
                 
                 # Only add homes that have required data
                 if home_data["name"] and home_data["url"]:
@@ -521,34 +766,38 @@ def parse_homesites(soup, driver):
                 logger.error(f"Error parsing home site: {str(e)}")
                 continue
     
+    # Get images from detail pages, in parallel when a driver pool is available
+    all_images = fetch_homesite_images(driver, [home["url"] for home in homesites], pool)
+    for home, detail_images in zip(homesites, all_images):
+        if detail_images:
+            home["images"] = detail_images
+            home["image_url"] = detail_images[0]  # Use first image as main image
+    
     return homesites
 
-def parse_amenities(soup):
-    """Parse community amenities"""
-    amenities = []
-    amenity_text = soup.find_all(string=re.compile(r'(RV Garage|Private Bedroom|Covered Entry|Sliding Door)'))
-    
-    for text in amenity_text:
-        try:
-            amenity_data = {
-                "name": clean_text(text),
-                "description": clean_text(text),
-                "icon_url": None
-            }
-            amenities.append(amenity_data)
-            
-        except Exception as e:
-            logger.error(f"Error parsing amenity: {str(e)}")
-            continue
+def parse_amenities(tree):
+    """Parse community amenities, one per amenity keyword found on the page"""
+    found = set()
+    for text in AMENITY_TEXT_XPATH(tree):
+        found.update(AMEN_RE.findall(text))
+        if len(found) == len(AMENITY_KEYWORDS):
+            break
     
-    return amenities
+    return [
+        {
+            "name": keyword,
+            "description": keyword,
+            "icon_url": None
+        }
+        for keyword in AMENITY_KEYWORDS if keyword in found
+    ]
 
-def parse_nearby_places(soup):
+def parse_nearby_places(tree):
     """Parse nearby places"""
     # This is placeholder data as the website doesn't show nearby places
     return []
 
-def parse_collections(soup):
+def parse_collections(tree):
     """Parse collections and nearby schools"""
     collections = []
     collection_names = ["Estates at Estrella Crossing"]
@@ -569,63 +818,315 @@ def parse_collections(soup):
     
     return collections
 
-def process_community_url(driver, url):
-    """Process a single community URL"""
+def load_cache_index():
+    """Load the URL -> page validators index"""
     try:
-        # Extract community name from URL to use in filename
-        community_name = url.split('/')[-2] if url.split('/')[-1].startswith('#') else url.split('/')[-1]
-        community_name = community_name.split('?')[0]  # Remove query parameters
+        if os.path.exists(CACHE_INDEX_FILE):
+            return read_json(CACHE_INDEX_FILE)
+    except Exception as e:
+        logger.error(f"Error reading cache index: {str(e)}")
+    return {}
+
+def save_cache_index(index):
+    """Persist the URL -> page validators index, replacing the file atomically"""
+    os.makedirs(os.path.dirname(CACHE_INDEX_FILE), exist_ok=True)
+    # Readers in other processes never see a half-written index
+    tmp_file = f"{CACHE_INDEX_FILE}.tmp"
+    write_json(tmp_file, index, pretty=False)
+    os.replace(tmp_file, CACHE_INDEX_FILE)
+
+def validators_from_headers(headers):
+    """Extract ETag/Last-Modified from response headers, or None if neither is sent"""
+    etag = headers.get('ETag')
+    last_modified = headers.get('Last-Modified')
+    if etag or last_modified:
+        return {"etag": etag, "last_modified": last_modified}
+    return None
+
+def fetch_static(url):
+    """Fetch raw HTML without a browser, returning (html, validators) or (None, None) on failure"""
+    try:
+        response = session.get(url, timeout=(15, 30))
+        response.raise_for_status()
+        return response.text, validators_from_headers(response.headers)
+    except Exception as e:
+        logger.error(f"Error fetching static HTML for {url}: {str(e)}")
+        return None, None
+
+def has_static_cards(html):
+    """Check whether static HTML already contains plan or home cards in their panels"""
+    try:
+        tree = lxml.html.fromstring(html)
+    except (etree.ParserError, ValueError):
+        return False
+    return any(
+        len(CARD_ITEMS_XPATH(panel)) > 0
+        for panel in PANELS_XPATH(tree) if panel.get('id') in STATIC_SENTINELS
+    )
+
+def get_page_validators(url):
+    """Fetch ETag/Last-Modified for a URL with a HEAD request"""
+    try:
+        response = session.head(url, allow_redirects=True, timeout=15)
+        response.raise_for_status()
+        return validators_from_headers(response.headers)
+    except Exception as e:
+        logger.error(f"Error checking headers for {url}: {str(e)}")
+    return None
+
+def get_cached_entry(cache_index, url, output_file):
+    """Cache index entry for a URL, only if the JSON it points to still exists"""
+    cached = cache_index.get(url)
+    if cached and cached.get("json_path") == output_file and os.path.exists(output_file):
+        return cached
+    return None
+
+def validators_match(cached, validators):
+    """Check whether freshly seen validators match a cache index entry"""
+    return bool(validators
+                and cached.get("etag") == validators["etag"]
+                and cached.get("last_modified") == validators["last_modified"])
+
+class DomainRateLimiter:
+    """Spaces out request starts to each host by a minimum delay"""
+    
+    def __init__(self, delay):
+        self.delay = delay
+        self._next_start = {}
+        self._lock = asyncio.Lock()
+    
+    async def wait(self, host):
+        """Sleep until the next request to host may start"""
+        async with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start.get(host, now))
+            self._next_start[host] = start + self.delay
+        await asyncio.sleep(start - now)
+
+async def fetch_static_async(client, semaphore, limiter, url, cached=None):
+    """Fetch raw HTML with the async client, returning (html, validators) or (None, None) on failure"""
+    # With a cache index entry the GET is conditional; a 304 returns (None, cached validators),
+    # which process_community_url then treats as unchanged
+    headers = {}
+    if cached:
+        if cached.get("etag"):
+            headers['If-None-Match'] = cached["etag"]
+        if cached.get("last_modified"):
+            headers['If-Modified-Since'] = cached["last_modified"]
+    async with semaphore:
+        await limiter.wait(urlsplit(url).hostname)
+        try:
+            response = await client.get(url, headers=headers, timeout=30)
+            if cached and response.status_code == 304:
+                return None, {"etag": cached.get("etag"), "last_modified": cached.get("last_modified")}
+            response.raise_for_status()
+            return response.text, validators_from_headers(response.headers)
+        except Exception as e:
+            logger.error(f"Error fetching static HTML for {url}: {str(e)}")
+            return None, None
+
+async def fetch_static_batch(urls, cached_entries=None):
+    """Fetch static HTML for many URLs concurrently, returning {url: (html, validators)}"""
+    cached_entries = cached_entries or {}
+    semaphore = asyncio.Semaphore(STATIC_CONCURRENCY)
+    limiter = DomainRateLimiter(STATIC_HOST_DELAY)
+    async with httpx.AsyncClient(
+        http2=True,
+        headers={'User-Agent': USER_AGENT},
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=STATIC_CONCURRENCY)
+    ) as client:
+        pages = await asyncio.gather(*(
+            fetch_static_async(client, semaphore, limiter, url, cached_entries.get(url)) for url in urls
+        ))
+    return dict(zip(urls, pages))
+
+def get_community_name(url):
+    """Extract community name from URL to use in filenames"""
+    community_name = url.split('/')[-2] if url.split('/')[-1].startswith('#') else url.split('/')[-1]
+    return community_name.split('?')[0]  # Remove query parameters
+
+def get_output_file(url):
+    """Path of the JSON output for a community URL"""
+    return f'data/ashtonwoods/json/ashtonwoods_{get_community_name(url)}.json'
+
+def process_community_url(driver, url, refresh=False, pool=None, html=None, validators=None, index_updates=None):
+    """Process a single community URL, using prefetched html/validators if given
+
+    With index_updates (a dict), the new cache index entry goes there instead of to disk,
+    for a batch worker process to hand back to the parent.
+
+    Returns the number of pages loaded in driver, so the caller can clear or recycle it.
+    """
+    loads = 0
+    try:
+        community_name = get_community_name(url)
         
         # Check if JSON already exists
-        output_file = f'data/ashtonwoods/json/ashtonwoods_{community_name}.json'
-        if os.path.exists(output_file):
+        output_file = get_output_file(url)
+        if os.path.exists(output_file) and not refresh:
             logger.info(f"Skipping {community_name} - JSON already exists at {output_file}")
-            return
+            return loads
+        
+        # Reuse the previous JSON if the page is unchanged since it was written; only
+        # pay for a HEAD request when there is a cached entry and no prefetched headers
+        cache_index = load_cache_index()
+        cached = get_cached_entry(cache_index, url, output_file)
+        if cached and validators_match(cached, validators or get_page_validators(url)):
+            logger.info(f"304-equivalent, reusing cached JSON for {community_name} at {output_file}")
+            return loads
             
         logger.info(f"Processing community: {community_name}")
         
-        # Get page
-        driver.get(url)
-        
-        # Wait for content to load
-        WebDriverWait(driver, 20).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "h1"))
-        )
-        time.sleep(5)  # Allow dynamic content to load
+        # Try plain HTTP first; only render in Selenium if the panels are missing
+        if html is None:
+            html, validators = fetch_static(url)
+        static = bool(html) and has_static_cards(html)
+        # Without Chrome only a static page whose detail pages go to the pool can be scraped
+        if driver is None and not (static and pool is not None):
+            logger.error(f"No Chrome driver available, skipping {community_name}")
+            return loads
+        if static:
+            logger.info(f"Using static HTML for {community_name}")
+        else:
+            # Get page
+            loads += 1
+            driver.get(url)
+            
+            # Wait for content to load
+            wait_for_community_content(driver)
+            html = driver.page_source
         
         # Save HTML content
         os.makedirs('data/ashtonwoods/html', exist_ok=True)
-        html_file = f'data/ashtonwoods/html/ashtonwoods_{community_name}.html'
-        with open(html_file, 'w', encoding='utf-8') as f:
-            f.write(driver.page_source)
+        html_file = f'data/ashtonwoods/html/ashtonwoods_{community_name}.html.gz'
+        with gzip.open(html_file, 'wt', encoding='utf-8', compresslevel=4) as f:
+            f.write(html)
         logger.info(f"HTML content has been saved to {html_file}")
         
         # Parse community data
-        data = parse_community_data(driver, url)
+        data = parse_community_data(driver, url, pool, html)
+        # Without a pool every homesite detail page is loaded in driver too
+        if pool is None:
+            loads += len(data.get("homesites", []))
         
         # Save JSON data
         os.makedirs('data/ashtonwoods/json', exist_ok=True)
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        write_json(output_file, data)
         logger.info(f"JSON data has been saved to {output_file}")
         
+        # Record the page validators so an unchanged page can be skipped next time
+        if validators:
+            entry = {**validators, "json_path": output_file}
+            if index_updates is not None:
+                index_updates[url] = entry
+            else:
+                cache_index[url] = entry
+                save_cache_index(cache_index)
+        
     except Exception as e:
         logger.error(f"Error processing {url}: {str(e)}")
+    
+    return loads
+
+class SharedRateLimiter:
+    """Spaces out request starts to each host across worker processes"""
+    
+    def __init__(self, next_start, lock, delay):
+        # next_start and lock are multiprocessing.Manager proxies shared by all workers
+        self.next_start = next_start
+        self.lock = lock
+        self.delay = delay
+    
+    def wait(self, host):
+        """Sleep until the next request to host may start"""
+        with self.lock:
+            now = time.time()
+            start = max(now, self.next_start.get(host, now))
+            self.next_start[host] = start + self.delay
+        time.sleep(start - now)
+
+# Per-process state for multiprocessing batch workers
+worker_driver = None
+worker_limiter = None
+worker_uses = 0
+
+def quit_worker_driver():
+    """Quit the Chrome driver owned by this worker process"""
+    if worker_driver is not None:
+        worker_driver.quit()
+
+def init_worker(limiter):
+    """Start the Chrome driver owned by a batch worker process"""
+    global worker_driver, worker_limiter
+    worker_limiter = limiter
+    worker_driver = start_driver()
+    # Pool workers exit without running atexit hooks, so register a multiprocessing finalizer
+    multiprocessing.util.Finalize(None, quit_worker_driver, exitpriority=10)
+
+def process_community_url_worker(task):
+    """Process one community URL in a batch worker process, returning (url, cache index entry or None)"""
+    global worker_driver, worker_uses
+    url, refresh = task
+    worker_limiter.wait(urlsplit(url).hostname)
+    # Retry Chrome if it failed to start or restart; static pages still go through without it
+    if worker_driver is None:
+        worker_driver = start_driver()
+    # Homesite detail pages are fetched serially with this worker's own driver, so
+    # every page it loads (community and detail pages) counts towards clearing/recycling it
+    # The parent is the only writer of the cache index, so hand the new entry back to it
+    index_updates = {}
+    loads = process_community_url(worker_driver, url, refresh, index_updates=index_updates)
+    if loads:
+        worker_uses += loads
+        fresh = maintain_driver(worker_driver, worker_uses, loads)
+        if fresh is not worker_driver:
+            worker_driver, worker_uses = fresh, 0
+    return url, index_updates.get(url)
+
+def process_batch_in_processes(urls, refresh, workers):
+    """Process community URLs with a pool of worker processes, each owning one Chrome"""
+    cache_index = load_cache_index()
+    with multiprocessing.Manager() as manager:
+        limiter = SharedRateLimiter(manager.dict(), manager.Lock(), STATIC_HOST_DELAY)
+        mp_pool = multiprocessing.Pool(workers, initializer=init_worker, initargs=(limiter,))
+        try:
+            for url, entry in mp_pool.imap_unordered(process_community_url_worker, [(url, refresh) for url in urls]):
+                logger.info(f"Finished {url}")
+                # Merge each worker's entry here so concurrent workers never overwrite each other's
+                if entry:
+                    cache_index[url] = entry
+                    save_cache_index(cache_index)
+            # close/join (not terminate) so each worker's finalizer quits its driver
+            mp_pool.close()
+            mp_pool.join()
+        except BaseException:
+            mp_pool.terminate()
+            raise
 
 def main():
     """Main function to scrape community data"""
     parser = argparse.ArgumentParser(description='Scrape Ashton Woods community data')
     parser.add_argument('--url', help='Single community URL to scrape')
     parser.add_argument('--batch', action='store_true', help='Process all URLs from ashtonwoods_links.json')
+    parser.add_argument('--refresh', action='store_true', help='Re-scrape existing communities unless the page is unchanged')
+    parser.add_argument('--workers', type=int, default=1, help='Worker processes for --batch, each with its own Chrome')
     args = parser.parse_args()
     
+    # The geocode shelve and its Nominatim rate limit are per-process, so keep geocoding single-process
+    if args.workers > 1 and GEOCODE_ENABLED:
+        parser.error('--workers > 1 cannot be combined with AW_GEOCODE=1')
+    
+    driver = None
+    pool = DriverPool(HOMESITE_WORKERS)
     try:
-        # Setup driver
-        driver = setup_driver()
+        # Setup driver, plus a pool for homesite detail pages; batch worker processes bring their own
+        if not (args.batch and args.workers > 1):
+            driver = setup_driver()
         
         if args.url:
             # Process single URL
-            process_community_url(driver, args.url)
+            process_community_url(driver, args.url, args.refresh, pool)
             
         elif args.batch:
             # Process multiple URLs from default JSON file
@@ -635,23 +1136,52 @@ def main():
                     logger.error(f"Error: {json_file} not found")
                     return
                     
-                with open(json_file, 'r') as f:
-                    urls = json.load(f)
+                urls = read_json(json_file)
                 logger.info(f"Found {len(urls)} URLs in {json_file}")
-                for url in urls:
-                    process_community_url(driver, url)
+                
+                pending = [url for url in urls if args.refresh or not os.path.exists(get_output_file(url))]
+                logger.info(f"Skipping {len(urls) - len(pending)} communities with existing JSON")
+                if args.workers > 1:
+                    process_batch_in_processes(pending, args.refresh, args.workers)
+                    return
+                
+                # Prefetch static HTML concurrently; process_community_url falls
+                # back to Selenium for pages whose static HTML lacks the panels
+                # With --refresh, pages that have a cached JSON are fetched conditionally so
+                # unchanged ones come back as 304 and are skipped without a GET body or HEAD
+                cache_index = load_cache_index() if args.refresh else {}
+                driver_uses = 0
+                for start in range(0, len(pending), STATIC_BATCH_SIZE):
+                    chunk = pending[start:start + STATIC_BATCH_SIZE]
+                    cached_entries = {url: get_cached_entry(cache_index, url, get_output_file(url)) for url in chunk}
+                    pages = asyncio.run(fetch_static_batch(chunk, cached_entries))
+                    for url in chunk:
+                        html, validators = pages.get(url, (None, None))
+                        # Retry Chrome if a recycle failed to restart it; static pages still go through without it
+                        if driver is None:
+                            driver = start_driver()
+                        # A failed prefetch passes '' so the page goes straight to Selenium
+                        # Only pages actually loaded in Chrome count towards clearing/recycling it
+                        loads = process_community_url(driver, url, args.refresh, pool, html or '', validators)
+                        if loads:
+                            driver_uses += loads
+                            fresh = maintain_driver(driver, driver_uses, loads)
+                            if fresh is not driver:
+                                driver, driver_uses = fresh, 0
             except Exception as e:
                 logger.error(f"Error reading URLs file: {str(e)}")
                 
         else:
             # Default URL if no arguments provided
             default_url = "https://www.ashtonwoods.com/phoenix/estrella-crossing-community?comm=PHO|MCESCR#quick-move-ins"
-            process_community_url(driver, default_url)
+            process_community_url(driver, default_url, args.refresh, pool)
         
     except Exception as e:
         logger.error(f"Error in main execution: {str(e)}")
     finally:
-        driver.quit()
+        pool.close()
+        if driver is not None:
+            driver.quit()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file